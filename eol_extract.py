@@ -0,0 +1,169 @@
+"""
+sw-eol-table extraction
+Shared by the MCP server and the test scripts to pull the EOL components out of
+Juniper's EOL pages
+"""
+
+import logging
+import re
+from typing import List, Dict, Any, FrozenSet, Iterator
+
+import lxml.html
+
+
+logger = logging.getLogger(__name__)
+
+# Literal every sw-eol-table component contains, used to locate candidates cheaply
+_SW_EOL_MARKER = b'"sw-eol-table"'
+
+# Pattern to match the sw-eol-table component structure
+# This pattern captures from the opening brace before "selector" to the closing brace
+_SW_EOL_RE = re.compile(
+    rb'\{\s*"selector"\s*:\s*"sw-eol-table"\s*,\s*"properties"\s*:\s*\{[^}]*"htmlContent"\s*:\s*\'([^\']*)\'\s*\}\s*\}',
+    re.DOTALL
+)
+
+
+def _iter_sw_eol_matches(content: bytes) -> Iterator[re.Match]:
+    """
+    Yield the sw-eol-table pattern matches found in the content.
+    
+    The content is searched for the "sw-eol-table" literal with bytes.find and
+    the pattern is only tried at the opening brace of each hit, instead of
+    running the full pattern over every position of the page.
+    
+    Args:
+        content: The full HTML/text content, as raw bytes
+        
+    Returns:
+        Iterator over the pattern matches, in order
+    """
+    start = 0
+    while True:
+        hit = content.find(_SW_EOL_MARKER, start)
+        if hit == -1:
+            return
+        
+        # The component opens with the nearest brace before the selector value
+        brace = content.rfind(b'{', start, hit)
+        match = _SW_EOL_RE.match(content, brace) if brace != -1 else None
+        if match:
+            yield match
+            start = match.end()
+        else:
+            start = hit + len(_SW_EOL_MARKER)
+
+
+def extract_sw_eol_tables(content: bytes) -> List[Dict[str, Any]]:
+    """
+    Extract all sw-eol-table components from the content.
+    
+    Args:
+        content: The full HTML/text content, as raw bytes
+        
+    Returns:
+        List of dictionaries containing sw-eol-table components
+    """
+    eol_tables = []
+    
+    matches = _iter_sw_eol_matches(content)
+    
+    for match in matches:
+        try:
+            # Extract the HTML content (only the captured group is copied out
+            # of the page and decoded; the full component text is never needed)
+            html_content = match.group(1).decode('utf-8', 'replace')
+            
+            # Create a component dictionary
+            component = {
+                "selector": "sw-eol-table",
+                "properties": {
+                    "htmlContent": html_content
+                }
+            }
+            
+            eol_tables.append(component)
+            
+        except Exception as e:
+            logger.warning("Error parsing component: %s", e)
+            continue
+    
+    return eol_tables
+
+
+def extract_eol_components(content: bytes) -> FrozenSet[str]:
+    """
+    Extract the names of the EOL components listed in all sw-eol-table components.
+    
+    Args:
+        content: The full HTML/text content, as raw bytes
+        
+    Returns:
+        Frozen set of EOL component names found across all sw-eol-table components
+    """
+    eol_components = set()
+    
+    for match in _iter_sw_eol_matches(content):
+        # The HTML content is a comma separated list of component names,
+        # each optionally followed by markup
+        eol_components.update(
+            item.partition('<')[0].strip()
+            for item in match.group(1).decode('utf-8', 'replace').split(',')
+        )
+    
+    return frozenset(eol_components)
+
+
+def _element_text(element) -> str:
+    """Return the stripped text of an element, like BeautifulSoup's get_text(strip=True)."""
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def parse_eol_table_html(html_content: str) -> List[Dict[str, Any]]:
+    """
+    Parse the HTML table content into structured data.
+    
+    Args:
+        html_content: HTML string containing the table
+        
+    Returns:
+        List of dictionaries representing table rows
+    """
+    if not html_content.strip():
+        return []
+    
+    root = lxml.html.fromstring(html_content)
+    tables = root.xpath('descendant-or-self::table')
+    
+    if not tables:
+        return []
+    table = tables[0]
+    
+    # Extract headers from the first row of the first thead
+    headers = [
+        _element_text(th)
+        for th in table.xpath('descendant::thead[1]/descendant::tr[1]/descendant::th')
+    ]
+    
+    # Extract rows
+    rows_data = []
+    for tr in table.xpath('descendant::tbody[1]/descendant::tr'):
+        row_dict = {}
+        cells = tr.xpath('descendant::td')
+        
+        for header, td in zip(headers, cells):
+            # Check for links
+            link = td.xpath('descendant::a[1]')
+            if link:
+                row_dict[header] = {
+                    'text': _element_text(td),
+                    'url': link[0].get('href', ''),
+                    'title': link[0].get('title', '')
+                }
+            else:
+                row_dict[header] = _element_text(td)
+        
+        if row_dict:
+            rows_data.append(row_dict)
+    
+    return rows_data
@@ -0,0 +1,25 @@
+"""
+FRU model number extraction
+Shared by the MCP server and the test scripts so there is a single compiled pattern
+"""
+
+import re
+from typing import List
+
+
+# Pattern to extract FRU model numbers (capital letters, numbers, hyphens with at least one hyphen)
+# found as the last whitespace-separated field of a line
+FRU_LINE_RE = re.compile(r'(?:^|\s)([A-Z0-9]+-[A-Z0-9-]+)[^\S\n]*$', re.MULTILINE)
+
+
+def extract_frus(hw_inventory: str) -> List[str]:
+    """
+    Extract the FRU model numbers from a hardware inventory.
+    
+    Args:
+        hw_inventory: Output of the 'show chassis hardware clei-models' command
+        
+    Returns:
+        List of FRU model numbers in inventory order, one entry per matching line
+    """
+    return FRU_LINE_RE.findall(hw_inventory)
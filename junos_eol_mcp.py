@@ -5,17 +5,82 @@ A simple MCP server with inventory management tools
 """
 
 import asyncio
+import functools
+import gzip
 import json
-from typing import List, Dict, Any
+import logging
+import os
+import time
+from collections import Counter
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 import mcp.server.stdio
-from bs4 import BeautifulSoup
+
+from eol_extract import extract_eol_components
+from fru_extract import FRU_LINE_RE, extract_frus
+
+try:
+    import requests
+except ImportError:
+    import urllib.error
+    import urllib.request
+    requests = None
+
+try:
+    # orjson serializes tool results several times faster than the json module
+    import orjson
+    
+    def _dumps(obj: Any) -> str:
+        """Serialize a tool result as indented JSON text."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects some values json accepts, such as integers beyond 64 bits
+            return json.dumps(obj, indent=2)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        """Serialize a tool result as indented JSON text."""
+        return json.dumps(obj, indent=2)
+    
+    _loads = json.loads
+
+
+# Headers sent with every EOL page download
+_HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# Shared HTTP session so repeated EOL downloads reuse the keep-alive connection
+if requests:
+    _SESSION = requests.Session()
+    _SESSION.headers.update(_HTTP_HEADERS)
+else:
+    _SESSION = None
+
+# Parsed EOL components per URL, revalidated with the page's ETag/Last-Modified
+_EOL_CACHE: Dict[str, Dict[str, Any]] = {}
+_EOL_CACHE_LOCKS: Dict[str, asyncio.Lock] = {}
+
+# On-disk copy of _EOL_CACHE so conditional requests survive server restarts
+_EOL_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "junos-eol", "eol.json")
+
+# Seconds a cached EOL page is trusted before it is revalidated with the server
+EOL_CACHE_TTL = 3600
+
+# Router connection details, parsed once and reloaded only when the file changes
+_DEVICES_FILE = "devices.json"
+_DEVICES_CACHE: Dict[str, Any] = {"mtime": None, "config": None}
 
 
 # Create server instance
 server = Server("inventory-server")
 
+# stdout carries the MCP stdio transport, so diagnostics go through logging
+logger = logging.getLogger(__name__)
+
 # Sample inventory data (in a real application, this would come from a database)
 SAMPLE_INVENTORY = {
     "items": [
@@ -26,203 +91,293 @@ SAMPLE_INVENTORY = {
     ]
 }
 
-async def extract_sw_eol_tables(content: str) -> List[Dict[str, Any]]:
+# Inventory items indexed by id for constant-time lookups
+_INVENTORY_BY_ID = {item["id"]: item for item in SAMPLE_INVENTORY["items"]}
+
+def _download_eol_page(eol_url: str, headers: Dict[str, str]) -> Tuple[int, bytes, Any]:
     """
-    Extract all sw-eol-table components from the content.
+    Download the EOL page, sending any conditional request headers given.
     
     Args:
-        content: The full HTML/text content
+        eol_url: URL of the EOL page
+        headers: Extra request headers (If-None-Match / If-Modified-Since)
         
     Returns:
-        List of dictionaries containing sw-eol-table components
+        Tuple of (HTTP status, raw page content, response headers). The
+        content is left undecoded and is empty when the server answers
+        304 Not Modified.
     """
-    eol_tables = []
-    
-    # Pattern to match the sw-eol-table component structure
-    # This pattern captures from the opening brace before "selector" to the closing brace
-    pattern = r'\{\s*"selector"\s*:\s*"sw-eol-table"\s*,\s*"properties"\s*:\s*\{[^}]*"htmlContent"\s*:\s*\'([^\']*)\'\s*\}\s*\}'
-    
-    matches = re.finditer(pattern, content, re.DOTALL)
+    if requests:
+        response = _SESSION.get(eol_url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            return 304, b'', response.headers
+        response.raise_for_status()
+        return response.status_code, response.content, response.headers
     
-    for match in matches:
-        try:
-            # Get the full matched component
-            component_text = match.group(0)
-            
-            # Extract the HTML content
-            html_content = match.group(1)
-            
-            # Create a component dictionary
-            component = {
-                "selector": "sw-eol-table",
-                "properties": {
-                    "htmlContent": html_content
-                }
-            }
-            
-            eol_tables.append(component)
-            
-        except Exception as e:
-            print(f"Warning: Error parsing component: {e}")
-            continue
-    
-    return eol_tables
+    req = urllib.request.Request(
+        eol_url,
+        headers={**_HTTP_HEADERS, 'Accept-Encoding': 'gzip', **headers}
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=10) as response:
+            body = response.read()
+            if response.headers.get('Content-Encoding') == 'gzip':
+                body = gzip.decompress(body)
+            return response.status, body, response.headers
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return 304, b'', e.headers
+        raise
 
-async def parse_eol_table_html(html_content: str) -> List[Dict[str, Any]]:
+def _parse_eol_cache_entry(entry: Any) -> Dict[str, Any]:
     """
-    Parse the HTML table content into structured data.
+    Validate one entry of the on-disk cache and convert it to its in-memory form.
     
     Args:
-        html_content: HTML string containing the table
+        entry: The entry as loaded from the cache file
         
     Returns:
-        List of dictionaries representing table rows
+        The _EOL_CACHE entry
+        
+    Raises:
+        TypeError, ValueError: If the entry does not have the expected shape
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    table = soup.find('table')
+    if not isinstance(entry, dict):
+        raise TypeError("entry is not an object")
     
-    if not table:
-        return []
+    # The validators are sent back as request headers, so they must be plain strings
+    for key in ("etag", "last_modified"):
+        value = entry.get(key)
+        if value is not None and (not isinstance(value, str) or '\r' in value or '\n' in value):
+            raise TypeError(f"{key} is not a header string")
     
-    # Extract headers
-    headers = []
-    thead = table.find('thead')
-    if thead:
-        header_row = thead.find('tr')
-        if header_row:
-            for th in header_row.find_all('th'):
-                headers.append(th.get_text(strip=True))
+    components = entry.get("components") or []
+    if not isinstance(components, list) or not all(isinstance(name, str) for name in components):
+        raise TypeError("components is not a list of strings")
     
-    # Extract rows
-    rows_data = []
-    tbody = table.find('tbody')
-    if tbody:
-        for tr in tbody.find_all('tr'):
-            row_dict = {}
-            cells = tr.find_all('td')
-            
-            for idx, td in enumerate(cells):
-                if idx < len(headers):
-                    header = headers[idx]
-                    
-                    # Check for links
-                    link = td.find('a')
-                    if link:
-                        row_dict[header] = {
-                            'text': td.get_text(strip=True),
-                            'url': link.get('href', ''),
-                            'title': link.get('title', '')
-                        }
-                    else:
-                        row_dict[header] = td.get_text(strip=True)
-            
-            if row_dict:
-                rows_data.append(row_dict)
-    
-    return rows_data
+    return {
+        "etag": entry.get("etag"),
+        "last_modified": entry.get("last_modified"),
+        # A timestamp in the future would keep the entry fresh forever
+        "fetched_at": min(float(entry.get("fetched_at") or 0), time.time()),
+        "components": frozenset(components),
+    }
 
-async def analyse_inventory_internal(hw_inventory: str, eol_url: str) -> list[TextContent]:
-    """Internal helper function to analyze inventory. Can be called by other tools."""
-    import re
+def _load_eol_cache() -> None:
+    """Populate _EOL_CACHE from the on-disk cache file, if there is one."""
     try:
-        import requests
-    except ImportError:
-        import urllib.request
-        requests = None
+        with open(_EOL_CACHE_FILE, 'r') as f:
+            entries = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.debug("EOL cache not loaded from %s: %s", _EOL_CACHE_FILE, e)
+        return
     
-    # Array to store all FRU model numbers
-    fru_list = []
+    # The file may be hand-edited or written by another version, so anything of
+    # the wrong shape is dropped instead of failing every analysis
+    if not isinstance(entries, dict):
+        logger.warning("Ignoring malformed EOL cache %s: expected an object", _EOL_CACHE_FILE)
+        return
     
-    # Pattern to validate FRU model numbers (capital letters, numbers, hyphens with at least one hyphen)
-    fru_pattern = r'^[A-Z0-9]+-[A-Z0-9-]+$'
+    for url, entry in entries.items():
+        try:
+            _EOL_CACHE.setdefault(url, _parse_eol_cache_entry(entry))
+        except (TypeError, ValueError) as e:
+            logger.warning("Ignoring malformed EOL cache entry for %s: %s", url, e)
+
+def _save_eol_cache() -> None:
+    """Write _EOL_CACHE to the on-disk cache file."""
+    entries = {
+        url: {
+            "etag": entry["etag"],
+            "last_modified": entry["last_modified"],
+            "fetched_at": entry["fetched_at"],
+            "components": sorted(entry["components"]),
+        }
+        for url, entry in _EOL_CACHE.items()
+    }
     
-    # Process the hardware inventory line by line
-    lines = hw_inventory.split('\n')
+    try:
+        os.makedirs(os.path.dirname(_EOL_CACHE_FILE), exist_ok=True)
+        # Write to a temporary file first so a crash never leaves a truncated cache
+        tmp_file = _EOL_CACHE_FILE + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(entries, f)
+        os.replace(tmp_file, _EOL_CACHE_FILE)
+    except OSError as e:
+        logger.warning("Could not write EOL cache %s: %s", _EOL_CACHE_FILE, e)
+
+def _load_devices() -> Dict[str, Any]:
+    """
+    Return the parsed devices.json, reusing the last parse while the file is unchanged.
     
-    for line in lines:
-        # Skip empty lines
-        if not line.strip():
-            continue
-        
-        # Split by any number of whitespaces
-        parts = line.split()
+    Returns:
+        Dictionary of router name to connection details
         
-        # Take the last element if it exists
-        if parts:
-            last_element = parts[-1]
-            
-            # Validate that it matches FRU format
-            if re.match(fru_pattern, last_element):
-                fru_list.append(last_element)
+    Raises:
+        FileNotFoundError: If devices.json does not exist
+        OSError, ValueError: If devices.json cannot be read or parsed
+    """
+    mtime = os.stat(_DEVICES_FILE).st_mtime_ns
+    if _DEVICES_CACHE["mtime"] != mtime:
+        with open(_DEVICES_FILE, 'rb') as f:
+            _DEVICES_CACHE["config"] = _loads(f.read())
+        _DEVICES_CACHE["mtime"] = mtime
+    return _DEVICES_CACHE["config"]
+
+async def get_eol_components(eol_url: str) -> FrozenSet[str]:
+    """
+    Get the set of EOL component names listed on an EOL page.
     
-    # Download the EOL page content
-    try:
-        if requests:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(eol_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            eol_page_content = response.text
-        else:
-            req = urllib.request.Request(
-                eol_url,
-                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                eol_page_content = response.read().decode('utf-8')
-    except Exception as e:
-        return [TextContent(
-            type="text",
-            text=json.dumps({
-                "error": f"Failed to download EOL page: {str(e)}",
-                "fru_list": fru_list,
-                "note": "The tool extracted FRU models but could not verify against Juniper's EOL database"
-            }, indent=2)
-        )]
+    The parsed set is cached per URL together with the page's ETag and
+    Last-Modified headers, in memory and in _EOL_CACHE_FILE. Within
+    EOL_CACHE_TTL seconds of the last check the cached set is returned
+    without any request. After that, later calls (also after a restart) send
+    a conditional request and reuse the cached set when the server answers
+    304 Not Modified.
+    
+    Args:
+        eol_url: URL of the EOL page
+        
+    Returns:
+        Frozen set of EOL component names (empty if no sw-eol-table was found)
+    """
+    lock = _EOL_CACHE_LOCKS.setdefault(eol_url, asyncio.Lock())
+    async with lock:
+        if not _EOL_CACHE:
+            _load_eol_cache()
+        
+        cached = _EOL_CACHE.get(eol_url)
+        if cached and time.time() - cached["fetched_at"] < EOL_CACHE_TTL:
+            return cached["components"]
+        
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers['If-None-Match'] = cached["etag"]
+            if cached["last_modified"]:
+                headers['If-Modified-Since'] = cached["last_modified"]
+        
+        # The download blocks, so run it in a worker thread to keep the event loop free
+        status, eol_page_content, response_headers = await asyncio.to_thread(
+            _download_eol_page, eol_url, headers
+        )
+        if status == 304 and cached:
+            cached["fetched_at"] = time.time()
+            _save_eol_cache()
+            return cached["components"]
+        
+        eol_components = extract_eol_components(eol_page_content)
+        
+        if not eol_components:
+            logger.warning("No sw-eol-table components found in the content.")
+            return eol_components
+        
+        _EOL_CACHE[eol_url] = {
+            "etag": response_headers.get('ETag'),
+            "last_modified": response_headers.get('Last-Modified'),
+            "fetched_at": time.time(),
+            "components": eol_components,
+        }
+        _save_eol_cache()
+        return eol_components
 
-    # Extract sw-eol-table components
-    tables_eol = extract_sw_eol_tables(eol_page_content)
+@functools.lru_cache(maxsize=256)
+def _find_eol_frus(
+    hw_inventory: str,
+    eol_components: FrozenSet[str]
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, int], ...]]:
+    """
+    Extract the FRU models from an inventory and count those that are EOL.
     
-    if not tables_eol:
-        print("No sw-eol-table components found in the content.")
-        return 1
+    The result depends only on the arguments, so it is memoized: analysing
+    the same inventory against the same EOL page again returns immediately.
+    Both arguments cache their hash, so building the key is cheap.
     
-    # Initialize the EOL list dictionary for found items
-    eol_list = {}
+    Args:
+        hw_inventory: The hardware inventory string from the router
+        eol_components: Frozen set of EOL component names
+        
+    Returns:
+        Tuple of (all FRU models in inventory order, (FRU, count) pairs of the EOL FRUs)
+    """
+    # Array to store all FRU model numbers, taken from the last field of each line
+    fru_list = extract_frus(hw_inventory)
+    logger.debug("fru_list is: %s", fru_list)
+    
+    # Count the FRUs found in the EOL components, probing each distinct FRU once
+    fru_counts = Counter(fru_list)
+    eol_list = tuple(
+        (fru, count) for fru, count in fru_counts.items() if fru in eol_components
+    )
     
-    # Search for each FRU in the EOL page content
-    for idx, tables_eol in enumerate(tables_eol, 1):
-        print ("fru_list is: ", fru_list)
-        eol_components_raw = tables_eol['properties']['htmlContent'].split(',')
-        eol_components_formatted = []
-        for item in eol_components_raw:
-            eol_components_formatted.append(item.strip().split('<')[0])
-        for fru in fru_list:
-            #print ("fru is: ", fru)
-            if fru in eol_components_formatted:
-                #print("encontro fru: ", fru)
-                if fru not in eol_list:
-                    eol_list[fru] = 0
-                eol_list[fru] += 1    
-
-    #for fru in fru_list:
-    #    if fru in eol_page_content:
-    #        if fru not in eol_list:
-    #            eol_list[fru] = 0
-    #        eol_list[fru] += 1
+    return tuple(fru_list), eol_list
+
+def _is_url_list(value: Any) -> bool:
+    """Return True if value is a list of URL strings, as the eol_urls argument must be."""
+    return isinstance(value, list) and all(isinstance(url, str) for url in value)
+
+async def analyse_inventory_internal(
+    hw_inventory: str,
+    eol_url: str,
+    extra_eol_urls: Optional[List[str]] = None
+) -> list[TextContent]:
+    """Internal helper function to analyze inventory. Can be called by other tools."""
+    # EOL pages to check, e.g. one per product family, without duplicates
+    eol_urls = list(dict.fromkeys([eol_url, *(extra_eol_urls or [])]))
+    
+    # Without any FRU model in the inventory there is nothing to look up,
+    # so skip downloading and parsing the EOL page
+    if not FRU_LINE_RE.search(hw_inventory):
+        fru_list, eol_frus = (), ()
+    else:
+        # Download the EOL pages concurrently
+        try:
+            components_per_url = await asyncio.gather(
+                *(get_eol_components(url) for url in eol_urls)
+            )
+        except Exception as e:
+            return [TextContent(
+                type="text",
+                text=_dumps({
+                    "error": f"Failed to download EOL page: {str(e)}",
+                    "fru_list": extract_frus(hw_inventory),
+                    "note": "The tool extracted FRU models but could not verify against Juniper's EOL database"
+                })
+            )]
+        
+        empty_urls = [url for url, components in zip(eol_urls, components_per_url) if not components]
+        if empty_urls:
+            return [TextContent(
+                type="text",
+                text=_dumps({
+                    "error": f"No sw-eol-table components found in the EOL page: {', '.join(empty_urls)}",
+                    "fru_list": extract_frus(hw_inventory),
+                    "eol_url": eol_url
+                })
+            )]
+        
+        # A single page keeps its cached set, so _find_eol_frus can hit its memo cache
+        if len(components_per_url) == 1:
+            eol_components = components_per_url[0]
+        else:
+            eol_components = frozenset().union(*components_per_url)
+        
+        fru_list, eol_frus = _find_eol_frus(hw_inventory, eol_components)
+    eol_list = dict(eol_frus)
     
     result = {
         "eol_list": eol_list,
         "total_eol_components": sum(eol_list.values()),
         "eol_parts_found": list(eol_list.keys()),
-        "fru_list": fru_list,
+        "fru_list": list(fru_list),
         "eol_url": eol_url
     }
+    if len(eol_urls) > 1:
+        result["eol_urls"] = eol_urls
     
     return [TextContent(
         type="text",
-        text=json.dumps(result, indent=2)
+        text=_dumps(result)
     )]
 
 
@@ -244,6 +399,13 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "URL to download EOL information from (default: https://support.juniper.net/support/eol/product/m_series/)",
                         "default": "https://support.juniper.net/support/eol/product/m_series/"
+                    },
+                    "eol_urls": {
+                        "type": "array",
+                        "description": "Optional: additional EOL URLs (e.g. other product families) checked together with eol_url. All pages are downloaded concurrently.",
+                        "items": {
+                            "type": "string",
+                        },
                     }
                 },
                 "required": ["router_name"],
@@ -276,6 +438,13 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "URL to download EOL information from (default: https://support.juniper.net/support/eol/product/m_series/)",
                         "default": "https://support.juniper.net/support/eol/product/m_series/"
+                    },
+                    "eol_urls": {
+                        "type": "array",
+                        "description": "Optional: additional EOL URLs (e.g. other product families) checked together with eol_url. All pages are downloaded concurrently.",
+                        "items": {
+                            "type": "string",
+                        },
                     }
                 },
                 "required": ["hw_inventory"],
@@ -326,29 +495,33 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls."""
     
     if name == "get_show_chassis":
-        import os
         router_name = arguments.get("router_name")
         eol_url = arguments.get("eol_url", "https://support.juniper.net/support/eol/product/m_series/")
+        eol_urls = arguments.get("eol_urls")
+        if eol_urls is not None and not _is_url_list(eol_urls):
+            return [TextContent(
+                type="text",
+                text=_dumps({
+                    "error": "eol_urls must be an array of URL strings"
+                })
+            )]
         
         # Load devices configuration
-        devices_file = "devices.json"
-        if not os.path.exists(devices_file):
+        try:
+            devices_config = _load_devices()
+        except FileNotFoundError:
             return [TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dumps({
                     "error": f"devices.json file not found. Please create it with router connection details."
-                }, indent=2)
+                })
             )]
-        
-        try:
-            with open(devices_file, 'r') as f:
-                devices_config = json.load(f)
         except Exception as e:
             return [TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dumps({
                     "error": f"Failed to read devices.json: {str(e)}"
-                }, indent=2)
+                })
             )]
         
         # Get router details
@@ -356,10 +529,10 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             available_routers = list(devices_config.keys())
             return [TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dumps({
                     "error": f"Router '{router_name}' not found in devices.json",
                     "available_routers": available_routers
-                }, indent=2)
+                })
             )]
         
         router_details = devices_config[router_name]
@@ -370,9 +543,9 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         except ImportError:
             return [TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dumps({
                     "error": "jnpr.junos library not installed. Install with: pip install junos-eznc"
-                }, indent=2)
+                })
             )]
         
         try:
@@ -407,15 +580,15 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         except Exception as e:
             return [TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dumps({
                     "error": f"Failed to connect to router or execute command: {str(e)}",
                     "router_name": router_name,
                     "router_ip": router_details['ip']
-                }, indent=2)
+                })
             )]
         
         # Now call analyse_inventory with the collected hw_inventory
-        analysis_result = await analyse_inventory_internal(hw_inventory, eol_url)
+        analysis_result = await analyse_inventory_internal(hw_inventory, eol_url, eol_urls)
         
         # Add router information to the result
         result = json.loads(analysis_result[0].text)
@@ -425,7 +598,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         
         return [TextContent(
             type="text",
-            text=json.dumps(result, indent=2)
+            text=_dumps(result)
         )]
     
     elif name == "get_inventory":
@@ -442,14 +615,22 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         
         return [TextContent(
             type="text",
-            text=json.dumps(result, indent=2)
+            text=_dumps(result)
         )]
     
     elif name == "analyse_inventory":
         hw_inventory = arguments.get("hw_inventory", "")
         eol_url = arguments.get("eol_url", "https://support.juniper.net/support/eol/product/m_series/")
+        eol_urls = arguments.get("eol_urls")
+        if eol_urls is not None and not _is_url_list(eol_urls):
+            return [TextContent(
+                type="text",
+                text=_dumps({
+                    "error": "eol_urls must be an array of URL strings"
+                })
+            )]
         
-        return await analyse_inventory_internal(hw_inventory, eol_url)
+        return await analyse_inventory_internal(hw_inventory, eol_url, eol_urls)
     
     elif name == "create_bom":
         product_name = arguments["product_name"]
@@ -465,10 +646,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             total_needed = quantity_needed * units_to_produce
             
             # Find the item in inventory
-            inventory_item = next(
-                (item for item in SAMPLE_INVENTORY["items"] if item["id"] == item_id),
-                None
-            )
+            inventory_item = _INVENTORY_BY_ID.get(item_id)
             
             if inventory_item:
                 available = inventory_item["quantity"]
@@ -505,7 +683,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         
         return [TextContent(
             type="text",
-            text=json.dumps(bom, indent=2)
+            text=_dumps(bom)
         )]
     
     else:
@@ -514,6 +692,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
 
 async def main():
     """Main entry point to run the server."""
+    logging.basicConfig(level=logging.WARNING)
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
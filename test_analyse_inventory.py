@@ -5,108 +5,16 @@ This script finds all occurrences of "selector":"sw-eol-table" and extracts
 the complete component including its properties.
 """
 
-import re
-import json
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-import urllib.request
+from collections import Counter
+import requests
 
+from eol_extract import extract_eol_components
+from fru_extract import extract_frus
 
-def extract_sw_eol_tables(content: str) -> List[Dict[str, Any]]:
-    """
-    Extract all sw-eol-table components from the content.
-    
-    Args:
-        content: The full HTML/text content
-        
-    Returns:
-        List of dictionaries containing sw-eol-table components
-    """
-    eol_tables = []
-    
-    # Pattern to match the sw-eol-table component structure
-    # This pattern captures from the opening brace before "selector" to the closing brace
-    pattern = r'\{\s*"selector"\s*:\s*"sw-eol-table"\s*,\s*"properties"\s*:\s*\{[^}]*"htmlContent"\s*:\s*\'([^\']*)\'\s*\}\s*\}'
-    
-    matches = re.finditer(pattern, content, re.DOTALL)
-    
-    for match in matches:
-        try:
-            # Get the full matched component
-            component_text = match.group(0)
-            
-            # Extract the HTML content
-            html_content = match.group(1)
-            
-            # Create a component dictionary
-            component = {
-                "selector": "sw-eol-table",
-                "properties": {
-                    "htmlContent": html_content
-                }
-            }
-            
-            eol_tables.append(component)
-            
-        except Exception as e:
-            print(f"Warning: Error parsing component: {e}")
-            continue
-    
-    return eol_tables
 
+# Shared HTTP session so repeated EOL downloads reuse the keep-alive connection
+_SESSION = requests.Session()
 
-def parse_eol_table_html(html_content: str) -> List[Dict[str, Any]]:
-    """
-    Parse the HTML table content into structured data.
-    
-    Args:
-        html_content: HTML string containing the table
-        
-    Returns:
-        List of dictionaries representing table rows
-    """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    table = soup.find('table')
-    
-    if not table:
-        return []
-    
-    # Extract headers
-    headers = []
-    thead = table.find('thead')
-    if thead:
-        header_row = thead.find('tr')
-        if header_row:
-            for th in header_row.find_all('th'):
-                headers.append(th.get_text(strip=True))
-    
-    # Extract rows
-    rows_data = []
-    tbody = table.find('tbody')
-    if tbody:
-        for tr in tbody.find_all('tr'):
-            row_dict = {}
-            cells = tr.find_all('td')
-            
-            for idx, td in enumerate(cells):
-                if idx < len(headers):
-                    header = headers[idx]
-                    
-                    # Check for links
-                    link = td.find('a')
-                    if link:
-                        row_dict[header] = {
-                            'text': td.get_text(strip=True),
-                            'url': link.get('href', ''),
-                            'title': link.get('title', '')
-                        }
-                    else:
-                        row_dict[header] = td.get_text(strip=True)
-            
-            if row_dict:
-                rows_data.append(row_dict)
-    
-    return rows_data
 
 #def save_results(tables: List[Dict[str, Any]], output_prefix: str = "eol_table"):
 #    """
@@ -193,8 +101,9 @@ def main():
     # Download eol_url
     try:
         print(f"\nDownloading EOL data from: {eol_url}")
-        with urllib.request.urlopen(eol_url) as response:
-            eol_page_content = response.read().decode('utf-8')
+        response = _SESSION.get(eol_url, timeout=30)
+        response.raise_for_status()
+        eol_page_content = response.content
         print(f"Successfully downloaded {len(eol_page_content)} bytes")
     except Exception as e:
         return {
@@ -203,10 +112,10 @@ def main():
     
     #print(f"Content length: {len(eol_page_content)} characters\n")
     
-    # Extract sw-eol-table components
-    tables_eol = extract_sw_eol_tables(eol_page_content)
+    # Extract the EOL components of all sw-eol-table components
+    eol_components = extract_eol_components(eol_page_content)
     
-    if not tables_eol:
+    if not eol_components:
         print("No sw-eol-table components found in the content.")
         return 1
     
@@ -220,53 +129,16 @@ def main():
     
     #save_results(tables, output_prefix)
 
-    # Array to store all FRU model numbers
-    fru_list = []
-    
-    # Pattern to validate FRU model numbers (capital letters, numbers, hyphens with at least one hyphen)
-    fru_pattern = r'^[A-Z0-9]+-[A-Z0-9-]+$'
-    
-    # Process the hardware inventory line by line
+    # Array to store all FRU model numbers, taken from the last field of each line
     hw_inventory = SAMPLE_HW_INVENTORY
-    lines = hw_inventory.split('\n')
-    
-    for line in lines:
-        # Skip empty lines
-        if not line.strip():
-            continue
-        
-        # Split by any number of whitespaces
-        parts = line.split()
-        
-        # Take the last element if it exists
-        if parts:
-            last_element = parts[-1]
-            
-            # Validate that it matches FRU format
-            if re.match(fru_pattern, last_element):
-                fru_list.append(last_element)
+    fru_list = extract_frus(hw_inventory)
 
     
     #compare results
-    eol_list = {}
-    for idx, tables_eol in enumerate(tables_eol, 1):
-        print ("fru_list is: ", fru_list)
-        eol_components_raw = tables_eol['properties']['htmlContent'].split(',')
-        eol_components_formatted = []
-        for item in eol_components_raw:
-            eol_components_formatted.append(item.strip().split('<')[0])
-
-        #print ("eol_components is: ", eol_components)
-        #for index in range(0,len(eol_components_formatted)):
-        #    print ("eol_components is: ", eol_components_formatted[index])
-        #print ("eol_components_raw: ", eol_components_raw)
-        for fru in fru_list:
-            print ("fru is: ", fru)
-            if fru in eol_components_formatted:
-                #print("encontro fru: ", fru)
-                if fru not in eol_list:
-                    eol_list[fru] = 0
-                eol_list[fru] += 1
+    print ("fru_list is: ", fru_list)
+    # Probe each distinct FRU once and report it with its inventory count
+    fru_counts = Counter(fru_list)
+    eol_list = {fru: count for fru, count in fru_counts.items() if fru in eol_components}
     
     #print(f"\n{'='*80}")
     #print("Extraction complete!")
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Tests for the EOL component cache and the multi-URL analysis of the MCP server.
+The EOL page download is stubbed, so no network access is needed.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+import junos_eol_mcp
+
+
+URL = "https://eol.example/m_series/"
+
+INVENTORY = """    Item             Version  Part number  CLEI code         FRU model number
+    Midplane         REV 57   777-777777   XXXXXXXXXX        CHAS-MX104-S
+    MIC 1            REV 30   777-777777   XXXXXXXXXX        MIC-3D-2XGE-XFP
+    MIC 1            REV 30   777-777777   XXXXXXXXXX        MIC-3D-2XGE-XFP
+    PEM 0            REV 06   777-777777   XXXXXXXXXX        PWR-MX104-DC-S"""
+
+
+def make_page(*components: str) -> bytes:
+    """Build an EOL page with one sw-eol-table listing the given components."""
+    html_content = ",".join(f"{name}<br>" for name in components)
+    return (
+        '<html><script>{"selector":"sw-eol-table","properties":'
+        '{"htmlContent":\'' + html_content + '\'}}</script></html>'
+    ).encode()
+
+
+class FakeEolSite:
+    """Stand-in for _download_eol_page serving pages with ETag revalidation."""
+
+    def __init__(self):
+        self.pages = {}
+        self.requests = []
+
+    def __call__(self, eol_url, headers):
+        self.requests.append((eol_url, dict(headers)))
+        page = self.pages[eol_url]
+        etag = f'"{hash(page)}"'
+        if headers.get('If-None-Match') == etag:
+            return 304, b'', {}
+        return 200, page, {'ETag': etag}
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    """Give every test an empty cache, a temporary cache file and a fake EOL site."""
+    fake = FakeEolSite()
+    monkeypatch.setattr(junos_eol_mcp, "_download_eol_page", fake)
+    monkeypatch.setattr(junos_eol_mcp, "_EOL_CACHE_FILE", str(tmp_path / "eol.json"))
+    monkeypatch.setattr(junos_eol_mcp, "_EOL_CACHE", {})
+    monkeypatch.setattr(junos_eol_mcp, "_EOL_CACHE_LOCKS", {})
+    junos_eol_mcp._find_eol_frus.cache_clear()
+    return fake
+
+
+def expire_cache():
+    """Make every cached entry older than the TTL."""
+    for entry in junos_eol_mcp._EOL_CACHE.values():
+        entry["fetched_at"] -= junos_eol_mcp.EOL_CACHE_TTL + 1
+
+
+def write_cache_file(content: str):
+    with open(junos_eol_mcp._EOL_CACHE_FILE, 'w') as f:
+        f.write(content)
+
+
+def test_cache_is_reloaded_from_disk(site):
+    site.pages[URL] = make_page("CHAS-MX104-S")
+    asyncio.run(junos_eol_mcp.get_eol_components(URL))
+
+    # A restarted server starts with an empty in-memory cache, here with a stale file
+    junos_eol_mcp._EOL_CACHE.clear()
+    with open(junos_eol_mcp._EOL_CACHE_FILE) as f:
+        entries = json.load(f)
+    entries[URL]["fetched_at"] -= junos_eol_mcp.EOL_CACHE_TTL + 1
+    write_cache_file(json.dumps(entries))
+    components = asyncio.run(junos_eol_mcp.get_eol_components(URL))
+
+    assert components == {"CHAS-MX104-S"}
+    assert site.requests[-1][1]['If-None-Match']
+    assert len(site.requests) == 2
+
+
+@pytest.mark.parametrize("content", [
+    '[]',
+    '"text"',
+    '{"%s": 1}' % URL,
+    '{"%s": {"fetched_at": null, "components": [["nested"]]}}' % URL,
+    '{"%s": {"fetched_at": "yesterday"}}' % URL,
+    '{"%s": {"etag": 123, "components": ["CHAS-MX104-S"]}}' % URL,
+    '{"%s": {"last_modified": ["Mon"], "components": ["CHAS-MX104-S"]}}' % URL,
+])
+def test_malformed_cache_file_is_ignored(site, content):
+    site.pages[URL] = make_page("CHAS-MX104-S")
+    write_cache_file(content)
+
+    components = asyncio.run(junos_eol_mcp.get_eol_components(URL))
+
+    assert components == {"CHAS-MX104-S"}
+    assert site.requests == [(URL, {})]
+    # The next save replaces the bad file with a valid one
+    with open(junos_eol_mcp._EOL_CACHE_FILE) as f:
+        assert json.load(f)[URL]["components"] == ["CHAS-MX104-S"]
+
+
+def test_malformed_entry_does_not_drop_the_others(site):
+    other_url = URL + "other/"
+    write_cache_file(json.dumps({
+        URL: {"etag": 123},
+        other_url: {"etag": '"v1"', "fetched_at": time.time(), "components": ["FOO-1"]},
+    }))
+
+    components = asyncio.run(junos_eol_mcp.get_eol_components(other_url))
+
+    assert components == {"FOO-1"}
+    assert site.requests == []
+    assert URL not in junos_eol_mcp._EOL_CACHE
+
+
+def test_future_fetched_at_is_clamped(site):
+    site.pages[URL] = make_page("CHAS-MX104-S")
+    write_cache_file(json.dumps({
+        URL: {"etag": None, "last_modified": None, "fetched_at": 1e12, "components": ["OLD-1"]},
+    }))
+
+    asyncio.run(junos_eol_mcp.get_eol_components(URL))
+    assert junos_eol_mcp._EOL_CACHE[URL]["fetched_at"] <= time.time()
+
+    # Once the clamped timestamp ages past the TTL the page is checked again
+    expire_cache()
+    components = asyncio.run(junos_eol_mcp.get_eol_components(URL))
+
+    assert components == {"CHAS-MX104-S"}
+    assert len(site.requests) == 1
+
+
+def test_stale_page_is_revalidated_with_etag(site):
+    site.pages[URL] = make_page("CHAS-MX104-S", "MIC-3D-2XGE-XFP")
+
+    first = asyncio.run(junos_eol_mcp.get_eol_components(URL))
+    expire_cache()
+    second = asyncio.run(junos_eol_mcp.get_eol_components(URL))
+
+    assert first == {"CHAS-MX104-S", "MIC-3D-2XGE-XFP"}
+    # The 304 answer reuses the cached set itself
+    assert second is first
+    assert site.requests[0] == (URL, {})
+    assert site.requests[1][1] == {'If-None-Match': f'"{hash(site.pages[URL])}"'}
+
+
+def test_changed_page_is_parsed_again(site):
+    site.pages[URL] = make_page("CHAS-MX104-S")
+    asyncio.run(junos_eol_mcp.get_eol_components(URL))
+
+    site.pages[URL] = make_page("CHAS-MX104-S", "PWR-MX104-DC-S")
+    expire_cache()
+    components = asyncio.run(junos_eol_mcp.get_eol_components(URL))
+
+    assert components == {"CHAS-MX104-S", "PWR-MX104-DC-S"}
+    assert len(site.requests) == 2
+
+
+def test_fresh_page_is_not_requested_again(site):
+    site.pages[URL] = make_page("CHAS-MX104-S")
+
+    for _ in range(3):
+        components = asyncio.run(junos_eol_mcp.get_eol_components(URL))
+
+    assert components == {"CHAS-MX104-S"}
+    assert len(site.requests) == 1
+
+
+def analyse(eol_urls=None) -> dict:
+    result = asyncio.run(junos_eol_mcp.analyse_inventory_internal(INVENTORY, URL, eol_urls))
+    return json.loads(result[0].text)
+
+
+def test_eol_urls_are_merged_and_deduplicated(site):
+    other_url = URL + "mx_series/"
+    site.pages[URL] = make_page("CHAS-MX104-S")
+    site.pages[other_url] = make_page("MIC-3D-2XGE-XFP")
+
+    result = analyse([other_url, URL, other_url])
+
+    assert result["eol_list"] == {"CHAS-MX104-S": 1, "MIC-3D-2XGE-XFP": 2}
+    assert result["total_eol_components"] == 3
+    assert result["eol_urls"] == [URL, other_url]
+    assert sorted(url for url, _ in site.requests) == sorted([URL, other_url])
+
+
+def test_single_eol_url_result_is_unchanged(site):
+    site.pages[URL] = make_page("CHAS-MX104-S")
+
+    result = analyse()
+
+    assert result["eol_list"] == {"CHAS-MX104-S": 1}
+    assert result["eol_url"] == URL
+    assert "eol_urls" not in result
+
+
+def test_empty_sw_eol_table_on_one_url_is_reported(site):
+    other_url = URL + "empty/"
+    site.pages[URL] = make_page("CHAS-MX104-S")
+    site.pages[other_url] = b'<html>no tables here</html>'
+
+    result = analyse([other_url])
+
+    assert result["error"] == f"No sw-eol-table components found in the EOL page: {other_url}"
+    assert result["fru_list"][0] == "CHAS-MX104-S"
+
+
+@pytest.mark.parametrize("tool, arguments", [
+    ("analyse_inventory", {"hw_inventory": INVENTORY}),
+    ("get_show_chassis", {"router_name": "ROUTERREC2"}),
+])
+@pytest.mark.parametrize("eol_urls", ["u3", [1], {"url": URL}])
+def test_call_tool_rejects_invalid_eol_urls(site, tool, arguments, eol_urls):
+    result = asyncio.run(junos_eol_mcp.call_tool(tool, {**arguments, "eol_urls": eol_urls}))
+
+    assert json.loads(result[0].text) == {"error": "eol_urls must be an array of URL strings"}
+    assert site.requests == []
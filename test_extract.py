@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the FRU and sw-eol-table extraction helpers.
+Both are checked against the straightforward implementations they replaced.
+"""
+
+import random
+import re
+
+import pytest
+
+from eol_extract import _SW_EOL_RE, _iter_sw_eol_matches
+from fru_extract import extract_frus
+
+
+def extract_frus_per_line(hw_inventory: str) -> list:
+    """The original FRU extraction: validate the last field of every line."""
+    fru_list = []
+    for line in hw_inventory.split('\n'):
+        if not line.strip():
+            continue
+        parts = line.split()
+        if parts and re.match(r'^[A-Z0-9]+-[A-Z0-9-]+$', parts[-1]):
+            fru_list.append(parts[-1])
+    return fru_list
+
+
+def sw_eol_matches(content: bytes) -> list:
+    return [(match.span(), match.group(1)) for match in _iter_sw_eol_matches(content)]
+
+
+def sw_eol_matches_finditer(content: bytes) -> list:
+    return [(match.span(), match.group(1)) for match in _SW_EOL_RE.finditer(content)]
+
+
+def component(html_content: bytes) -> bytes:
+    return b'{"selector": "sw-eol-table", "properties": {"htmlContent": \'' + html_content + b'\'}}'
+
+
+@pytest.mark.parametrize("hw_inventory", [
+    "Midplane  REV 57  777-777777  CHAS-MX104-S\nPEM 0  REV 06  PWR-MX104-DC-S\n",
+    "Midplane  REV 57  CHAS-MX104-S\r\nPEM 0  REV 06  PWR-MX104-DC-S\r\n",
+    "Midplane  REV 57  CHAS-MX104-S   \t\nFPC 0  BUILTIN  \n",
+    "CHAS-MX104-S\nRE-S-MX104-S",
+    "FPC 0  MIC-\nFPC 1  MIC--\nFPC 2  -MIC-3D\nFPC 3  mic-3d",
+    "FPC 0  MIC-3D CHAS-MX104-S\nFPC 1  CHAS-MX104-S MIC",
+    "Midplane\xa0CHAS-MX104-S\nPEM 0\x1cPWR-MX104-DC-S\x1f\n",
+    "",
+    "\n\n   \n",
+])
+def test_extract_frus_matches_per_line_loop(hw_inventory):
+    assert extract_frus(hw_inventory) == extract_frus_per_line(hw_inventory)
+
+
+def test_extract_frus_matches_per_line_loop_on_random_input():
+    rng = random.Random(0)
+    alphabet = ['A', 'Z', '0', '9', '-', 'a', ' ', '\t', '\n', '\r', '\x0b', '\x0c',
+                '\xa0', '\x1c', '\x1f', '\x85', ' ', '　', 'AB-1', 'x-Y']
+    for _ in range(20000):
+        hw_inventory = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 14)))
+        assert extract_frus(hw_inventory) == extract_frus_per_line(hw_inventory), repr(hw_inventory)
+
+
+@pytest.mark.parametrize("content", [
+    b'<html>' + component(b'CHAS-MX104-S<br>,MIC-3D-2XGE-XFP') + b'</html>',
+    component(b'A-1') + b' ' + component(b'B-2'),
+    # The marker inside htmlContent must not start a second match
+    component(b'A-1 "sw-eol-table" B-2'),
+    # A failed candidate followed by a valid one
+    b'{"selector": "sw-eol-table", "properties": {}} ' + component(b'A-1'),
+    b'{"selector": "sw-eol-table"' + component(b'A-1'),
+    b'"sw-eol-table" {' + component(b'A-1'),
+    b'no components here',
+])
+def test_iter_sw_eol_matches_matches_finditer(content):
+    assert sw_eol_matches(content) == sw_eol_matches_finditer(content)
+
+
+def test_iter_sw_eol_matches_matches_finditer_on_random_input():
+    rng = random.Random(0)
+    pieces = [b'{', b'}', b' ', b'\n', b',', b':', b"'", b'x', b'"selector"', b'"sw-eol-table"',
+              b'"properties"', b'"htmlContent"', component(b'A-1'), component(b"B-2,'")]
+    for _ in range(20000):
+        content = b''.join(rng.choice(pieces) for _ in range(rng.randint(0, 16)))
+        assert sw_eol_matches(content) == sw_eol_matches_finditer(content), content
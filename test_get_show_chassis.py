@@ -5,6 +5,18 @@ This demonstrates how the tool would work (using mock data since we can't connec
 """
 
 import json
+import sys
+
+from fru_extract import extract_frus
+
+# Router connection details, loaded once when the script is imported
+try:
+    with open('devices.json', 'r') as f:
+        _DEVICES = json.load(f)
+    _DEVICES_ERROR = None
+except Exception as e:
+    _DEVICES = None
+    _DEVICES_ERROR = e
 
 # Mock hardware inventory that would be collected from the router
 MOCK_HW_INVENTORY = """user@ROUTERREC2-re0> show chassis hardware clei-models
@@ -38,14 +50,12 @@ def test_get_show_chassis():
     # Step 1: Load devices.json
     print("\nStep 1: Loading devices.json")
     print("-" * 80)
-    try:
-        with open('devices.json', 'r') as f:
-            devices_config = json.load(f)
-        print(f"✓ Loaded devices.json successfully")
-        print(f"✓ Available routers: {list(devices_config.keys())}")
-    except Exception as e:
-        print(f"✗ Failed to load devices.json: {e}")
+    if _DEVICES is None:
+        print(f"✗ Failed to load devices.json: {_DEVICES_ERROR}")
         return
+    devices_config = _DEVICES
+    print(f"✓ Loaded devices.json successfully")
+    print(f"✓ Available routers: {list(devices_config.keys())}")
     
     # Step 2: Get router details
     router_name = "ROUTERREC2"
@@ -77,22 +87,10 @@ def test_get_show_chassis():
     print(f"\nStep 4: Extracting FRU models from output")
     print("-" * 80)
     
-    import re
-    fru_list = []
-    fru_pattern = r'^[A-Z0-9]+-[A-Z0-9-]+$'
-    
-    for line in hw_inventory.split('\n'):
-        if not line.strip():
-            continue
-        parts = line.split()
-        if parts:
-            last_element = parts[-1]
-            if re.match(fru_pattern, last_element):
-                fru_list.append(last_element)
+    fru_list = extract_frus(hw_inventory)
     
     print(f"✓ Extracted {len(fru_list)} FRU models:")
-    for i, fru in enumerate(fru_list, 1):
-        print(f"  {i:2d}. {fru}")
+    sys.stdout.write("".join(f"  {i:2d}. {fru}\n" for i, fru in enumerate(fru_list, 1)))
     
     # Step 5: Analyze for EOL (would download from Juniper website)
     print(f"\nStep 5: Analyzing for EOL components")